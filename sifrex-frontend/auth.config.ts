@@ -1,99 +1,26 @@
 import type { NextAuthConfig } from 'next-auth'
 import Google from 'next-auth/providers/google'
-import Credentials from 'next-auth/providers/credentials'
-import { SigninFormSchema } from '@/lib/auth/definitions'
-import bcrypt from 'bcryptjs'
-import { prisma } from '@/lib/auth/prisma'
-import { checkRateLimit } from '@/lib/auth/rate-limiting'
 
+// Edge-safe configuration shared by the middleware and auth.ts.
+// Keep Node-only dependencies (Prisma, bcrypt) out of this file: providers
+// that need them are added in auth.ts, so the middleware bundle never
+// loads the database client.
 export default {
+  session: { 
+    strategy: 'jwt',
+    maxAge: 24 * 60 * 60, // 24 hours
+    updateAge: 60 * 60,   // 1 hour
+  },
+  jwt: {
+    maxAge: 24 * 60 * 60, // 24 hours
+  },
+
   providers: [
     // Google OAuth Provider
     Google({
       clientId: process.env.AUTH_GOOGLE_ID,
       clientSecret: process.env.AUTH_GOOGLE_SECRET,
     }),
-    
-    // Email/Password Credentials
-    Credentials({
-      credentials: {
-        email: {
-          label: "Email",
-          type: "email",
-          placeholder: "john@example.com"
-        },
-        password: {
-          label: "Password", 
-          type: "password",
-          placeholder: "Your password"
-        }
-      },
-      async authorize(credentials) {
-        try {
-          // Validate credentials using Zod
-          const parsedCredentials = SigninFormSchema.safeParse(credentials)
-
-          if (!parsedCredentials.success) {
-            // SECURITY: Don't log sensitive validation errors in production
-            if (process.env.NODE_ENV === 'development') {
-              console.log('Invalid credentials format')
-            }
-            return null
-          }
-
-          const { email, password } = parsedCredentials.data
-          
-          // SECURITY: Rate limiting to prevent brute force attacks
-          const rateLimitResult = checkRateLimit(email);
-          if (!rateLimitResult.allowed) {
-            if (process.env.NODE_ENV === 'development') {
-              console.log(`Rate limit exceeded for ${email}`);
-            }
-            return null;
-          }
-          
-          // Find user in database
-          const user = await prisma.user.findUnique({
-            where: { email },
-            select: {
-              id: true,
-              email: true,
-              name: true,
-              password: true,
-              role: true,
-            }
-          })
-
-          if (!user || !user.password) {
-            if (process.env.NODE_ENV === 'development') {
-              console.log('User not found or no password set')
-            }
-            return null
-          }
-
-          // Verify password
-          const passwordsMatch = await bcrypt.compare(password, user.password)
-          
-          if (!passwordsMatch) {
-            if (process.env.NODE_ENV === 'development') {
-              console.log('Password does not match')
-            }
-            return null
-          }
-
-          // Return user object (without password)
-          return {
-            id: user.id,
-            email: user.email,
-            name: user.name,
-            role: user.role,
-          }
-        } catch (error) {
-          console.log('Error in authorize:', error)
-          return null
-        }
-      },
-    }),
   ],
   
   pages: {
@@ -102,23 +29,8 @@ export default {
   },
   
   callbacks: {
-    authorized({ auth, request: { nextUrl } }) {
-      const isLoggedIn = !!auth?.user
-      const isOnDashboard = nextUrl.pathname.includes('/dashboard')
-      
-      // Extract locale from path
-      const locale = nextUrl.pathname.split('/')[1] || 'es'
-      
-      if (isOnDashboard) {
-        if (isLoggedIn) return true
-        return false // Redirect unauthenticated users to login page
-      } else if (isLoggedIn) {
-        return Response.redirect(new URL(`/${locale}/dashboard`, nextUrl))
-      }
-      
-      return true
-    },
-    
+    // No `authorized` callback: route-level redirects (locale, signin,
+    // dashboard) live in a single pass in src/middleware.ts.
     jwt({ token, user }) {
       if (user) {
         token.role = user.role
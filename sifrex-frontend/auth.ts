@@ -1,6 +1,10 @@
 import NextAuth from 'next-auth'
 import { PrismaAdapter } from '@auth/prisma-adapter'
+import Credentials from 'next-auth/providers/credentials'
+import bcrypt from 'bcryptjs'
 import { prisma } from '@/lib/auth/prisma'
+import { SigninFormSchema } from '@/lib/auth/definitions'
+import { checkRateLimit } from '@/lib/auth/rate-limiting'
 import authConfig from './auth.config'
 
 // Database connection validation
@@ -16,15 +20,91 @@ const isDatabaseConnected = async () => {
 
 export const { handlers, auth, signIn, signOut } = NextAuth({
   adapter: PrismaAdapter(prisma),
-  session: { 
-    strategy: 'jwt',
-    maxAge: 24 * 60 * 60, // 24 hours
-    updateAge: 60 * 60,   // 1 hour
-  },
-  jwt: {
-    maxAge: 24 * 60 * 60, // 24 hours
-  },
   ...authConfig,
+  providers: [
+    ...authConfig.providers,
+
+    // Email/Password Credentials
+    Credentials({
+      credentials: {
+        email: {
+          label: "Email",
+          type: "email",
+          placeholder: "john@example.com"
+        },
+        password: {
+          label: "Password", 
+          type: "password",
+          placeholder: "Your password"
+        }
+      },
+      async authorize(credentials) {
+        try {
+          // Validate credentials using Zod
+          const parsedCredentials = SigninFormSchema.safeParse(credentials)
+
+          if (!parsedCredentials.success) {
+            // SECURITY: Don't log sensitive validation errors in production
+            if (process.env.NODE_ENV === 'development') {
+              console.log('Invalid credentials format')
+            }
+            return null
+          }
+
+          const { email, password } = parsedCredentials.data
+          
+          // SECURITY: Rate limiting to prevent brute force attacks
+          const rateLimitResult = checkRateLimit(email);
+          if (!rateLimitResult.allowed) {
+            if (process.env.NODE_ENV === 'development') {
+              console.log(`Rate limit exceeded for ${email}`);
+            }
+            return null;
+          }
+          
+          // Find user in database
+          const user = await prisma.user.findUnique({
+            where: { email },
+            select: {
+              id: true,
+              email: true,
+              name: true,
+              password: true,
+              role: true,
+            }
+          })
+
+          if (!user || !user.password) {
+            if (process.env.NODE_ENV === 'development') {
+              console.log('User not found or no password set')
+            }
+            return null
+          }
+
+          // Verify password
+          const passwordsMatch = await bcrypt.compare(password, user.password)
+          
+          if (!passwordsMatch) {
+            if (process.env.NODE_ENV === 'development') {
+              console.log('Password does not match')
+            }
+            return null
+          }
+
+          // Return user object (without password)
+          return {
+            id: user.id,
+            email: user.email,
+            name: user.name,
+            role: user.role,
+          }
+        } catch (error) {
+          console.log('Error in authorize:', error)
+          return null
+        }
+      },
+    }),
+  ],
 })
 
 // Export database connection check for development
@@ -50,6 +50,7 @@ checkEnvFile(envLocalFile, '.env.local');
 // Check 2: Code analysis
 const filesToCheck = [
   '../src/lib/dal.ts',
+  '../src/lib/auth/dev-bypass.ts',
   '../src/middleware.ts'
 ];
 
@@ -13,9 +13,10 @@ import { AppSidebar } from "@/components/app-sidebar";
 import { SiteHeader } from "@/components/site-header";
 import { ThemeProvider } from "next-themes";
 import React from 'react'; // Importar React si no está implícito
+import { defaultLocale, isLocale } from '@/lib/i18n'; // Configuración de i18n compartida con el middleware
 
-// --- Configuración de Internacionalización (i18n) ---
-const locales = ['es', 'en']; // Idiomas soportados por tu aplicación
+// Trazas de depuración solo en desarrollo
+const isDev = process.env.NODE_ENV === 'development';
 
 export default async function AppProtectedLocaleLayout({ // O el nombre que le hayas dado
   children,
@@ -28,12 +29,12 @@ export default async function AppProtectedLocaleLayout({ // O el nombre que le h
   const resolvedParams = await params; 
   const { locale } = resolvedParams;
   
-  console.log(`RENDER: app/[locale]/(app)/layout.tsx (Main App Layout) for locale: ${locale}`); 
+  if (isDev) console.log(`RENDER: app/[locale]/(app)/layout.tsx (Main App Layout) for locale: ${locale}`); 
 
   // 1. Validación del Locale de la URL
-  if (!locales.includes(locale)) {
-    console.log(`REDIRECT: app/[locale]/layout.tsx - Invalid locale: ${locale}. Redirecting to /es`); // <--- LOG AÑADIDO
-    redirect('/es'); // Puedes ajustar esto a tu lógica de fallback o error 404
+  if (!isLocale(locale)) {
+    if (isDev) console.log(`REDIRECT: app/[locale]/layout.tsx - Invalid locale: ${locale}. Redirecting to /${defaultLocale}`); // <--- LOG AÑADIDO
+    redirect(`/${defaultLocale}`); // Puedes ajustar esto a tu lógica de fallback o error 404
   }
 
   // --- 2. Lógica de Autenticación y Autorización (Servidor) ---
@@ -41,12 +42,12 @@ export default async function AppProtectedLocaleLayout({ // O el nombre que le h
   // La función `verifySession` redirigirá automáticamente a la página de login
   // si el usuario no está autenticado o la sesión es inválida.
   // Si esta función lanza un redirect, el resto de este componente NO se ejecutará.
-  console.log('CALL: verifySession from app/[locale]/layout.tsx'); // <--- LOG AÑADIDO
+  if (isDev) console.log('CALL: verifySession from app/[locale]/layout.tsx'); // <--- LOG AÑADIDO
   const { isAuth, userId } = await verifySession(); //
 
   // Si llegamos aquí, significa que `verifySession()` ha validado exitosamente la sesión
   // y el usuario está autenticado. Ahora podemos renderizar el layout completo de la aplicación.
-  console.log(`AUTH_STATUS: User isAuth: ${isAuth}, userId: ${userId} in app/[locale]/layout.tsx`); // <--- LOG AÑADIDO
+  if (isDev) console.log(`AUTH_STATUS: User isAuth: ${isAuth}, userId: ${userId} in app/[locale]/layout.tsx`); // <--- LOG AÑADIDO
   return (
     // 3. Proporcionar la sesión a los componentes cliente
     // SessionProvider debe envolver todo lo que necesite acceder a la sesión vía `useSession`
@@ -1,5 +1,17 @@
 // app/[locale]/auth/layout.tsx
 
+import { locales } from '@/lib/i18n';
+
+// Trazas de depuración solo en desarrollo
+const isDev = process.env.NODE_ENV === 'development';
+
+// Las páginas de autenticación no dependen de la sesión ni de datos del servidor,
+// así que se pre-renderizan en el build para cada locale en lugar de renderizarse
+// en cada solicitud.
+export function generateStaticParams() {
+  return locales.map((locale) => ({ locale }));
+}
+
 // Este layout envolverá tus páginas de autenticación (signin, signup, etc.).
 // Asegúrate de que sea lo más mínimo posible para no mostrar la UI de la aplicación.
 export default function AuthLayout({
@@ -7,7 +19,7 @@ export default function AuthLayout({
   }: {
     children: React.ReactNode;
   }) {
-    console.log('RENDER: app/[locale]/auth/layout.tsx (Auth Layout)'); // <--- LOG AÑADIDO
+    if (isDev) console.log('RENDER: app/[locale]/auth/layout.tsx (Auth Layout)'); // <--- LOG AÑADIDO
     return (
       // No incluyas Sidebar, Navbar, Footer aquí.
       // Solo renderiza los children, que serán tus páginas de autenticación.
@@ -1,7 +1,7 @@
 // app/[locale]/auth/signin/page.tsx
 'use client'
 
-import { useState } from 'react'
+import { Suspense, useState } from 'react'
 import { signIn } from 'next-auth/react'
 import { useRouter, useSearchParams } from 'next/navigation'
 import Link from 'next/link'
@@ -11,10 +11,70 @@ import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
 import { Card, CardContent, CardDescription, CardFooter, CardHeader, CardTitle } from '@/components/ui/card'
 import { Alert, AlertDescription } from '@/components/ui/alert'
+import { Skeleton } from '@/components/ui/skeleton'
 import { Loader2, Mail, Lock } from 'lucide-react'
 import GoogleIcon from '@/assets/icons/google.svg'
 import React from 'react'
 
+// SECURITY: Validate callback URL to prevent open redirects
+function validateCallbackUrl(locale: string, url: string | null): string {
+  if (!url) return `/${locale}/dashboard`;
+  
+  // Only allow relative URLs starting with the current locale
+  if (url.startsWith(`/${locale}/`) && !url.includes('://')) {
+    return url;
+  }
+  
+  // Fallback to dashboard if invalid
+  return `/${locale}/dashboard`;
+}
+
+// Único componente que lee los search params durante el render.
+// useSearchParams() no tiene valor en el pre-renderizado estático, así que este botón
+// va dentro de su propio <Suspense>: el resto del formulario se genera en el HTML del build.
+function GoogleSignInButton({
+  locale,
+  disabled,
+  onStart,
+  onError,
+}: {
+  locale: string
+  disabled: boolean
+  onStart: () => void
+  onError: () => void
+}) {
+  const searchParams = useSearchParams()
+  const callbackUrl = validateCallbackUrl(locale, searchParams.get('callbackUrl'))
+
+  const handleGoogleSignIn = async () => {
+    onStart()
+    try {
+      // callbackUrl ya incluye el locale, lo cual es correcto.
+      await signIn('google', { callbackUrl }) 
+    } catch {
+      onError()
+    }
+  }
+
+  return (
+    <Button
+      variant="outline"
+      onClick={handleGoogleSignIn}
+      disabled={disabled}
+      className="w-full"
+    >
+      <Image 
+        src={GoogleIcon} 
+        alt="Google" 
+        width={16} 
+        height={16} 
+        className="mr-2"
+      />
+      Continue with Google
+    </Button>
+  )
+}
+
 // Ajusta el tipo de params para reflejar que es una Promise
 export default function SignInPage({ params }: { params: Promise<{ locale: string }> }) {
   const [email, setEmail] = useState('')
@@ -27,22 +87,7 @@ export default function SignInPage({ params }: { params: Promise<{ locale: strin
   const { locale } = resolvedParams; // Destructura locale del objeto resuelto
   
   const router = useRouter()
-  const searchParams = useSearchParams()
-  
-  // SECURITY: Validate callback URL to prevent open redirects
-  const validateCallbackUrl = (url: string | null): string => {
-    if (!url) return `/${locale}/dashboard`;
-    
-    // Only allow relative URLs starting with the current locale
-    if (url.startsWith(`/${locale}/`) && !url.includes('://')) {
-      return url;
-    }
-    
-    // Fallback to dashboard if invalid
-    return `/${locale}/dashboard`;
-  }
-  
-  const callbackUrl = validateCallbackUrl(searchParams.get('callbackUrl'))
+
   const handleCredentialsSignIn = async (e: React.FormEvent) => {
     e.preventDefault()
     setIsLoading(true)
@@ -60,6 +105,11 @@ export default function SignInPage({ params }: { params: Promise<{ locale: strin
       } else {
         // Asegúrate de que router.push maneje el locale correctamente si callbackUrl no lo tiene.
         // Pero tu callbackUrl ya lo incluye, así que está bien.
+        // Se lee al enviar (no durante el render) para no depender de useSearchParams() aquí.
+        const callbackUrl = validateCallbackUrl(
+          locale,
+          new URLSearchParams(window.location.search).get('callbackUrl'),
+        )
         router.push(callbackUrl)
       }
     } catch {
@@ -69,17 +119,6 @@ export default function SignInPage({ params }: { params: Promise<{ locale: strin
     }
   }
 
-  const handleGoogleSignIn = async () => {
-    setIsLoading(true)
-    try {
-      // callbackUrl ya incluye el locale, lo cual es correcto.
-      await signIn('google', { callbackUrl }) 
-    } catch {
-      setError('Failed to sign in with Google')
-      setIsLoading(false)
-    }
-  }
-
   return (
     // Contenido JSX de tu página de login (como lo tienes ahora)
     <div className="min-h-screen flex items-center justify-center bg-gradient-to-br from-gray-50 to-gray-100 dark:from-gray-900 dark:to-gray-800 px-4">
@@ -99,21 +138,17 @@ export default function SignInPage({ params }: { params: Promise<{ locale: strin
           )}
 
           {/* Google Sign In */}
-          <Button
-            variant="outline"
-            onClick={handleGoogleSignIn}
-            disabled={isLoading}
-            className="w-full"
-          >
-            <Image 
-              src={GoogleIcon} 
-              alt="Google" 
-              width={16} 
-              height={16} 
-              className="mr-2"
+          <Suspense fallback={<Skeleton className="h-9 w-full" />}>
+            <GoogleSignInButton
+              locale={locale}
+              disabled={isLoading}
+              onStart={() => setIsLoading(true)}
+              onError={() => {
+                setError('Failed to sign in with Google')
+                setIsLoading(false)
+              }}
             />
-            Continue with Google
-          </Button>
+          </Suspense>
 
           <div className="relative">
             <div className="absolute inset-0 flex items-center">
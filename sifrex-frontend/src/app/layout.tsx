@@ -5,6 +5,9 @@ import "./globals.css";
 // Configure font
 const inter = Inter({ subsets: ['latin'] });
 
+// Trazas de depuración solo en desarrollo
+const isDev = process.env.NODE_ENV === 'development';
+
 export const metadata = {
   title: "Sifrex",
   description: "Sifrex Research",
@@ -16,7 +19,7 @@ export default function RootLayout({
 }: {
   children: React.ReactNode;
 }) {
-  console.log('RENDER: app/layout.tsx (Root Layout)'); // <--- LOG AÑADIDO
+  if (isDev) console.log('RENDER: app/layout.tsx (Root Layout)'); // <--- LOG AÑADIDO
   return (
     <html suppressHydrationWarning>
       <head>
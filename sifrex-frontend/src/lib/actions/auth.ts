@@ -3,9 +3,8 @@
 
 'use server'
 
-import { z } from 'zod'
 import bcrypt from 'bcryptjs'
-import { SignupFormSchema, type FormState } from '@/lib/auth/definitions'
+import { SignupFormSchema, EmailSchema, type FormState } from '@/lib/auth/definitions'
 import { prisma } from '@/lib/auth/prisma'
 import { Prisma, Role } from '@prisma/client'
 
@@ -111,8 +110,7 @@ export async function signup(
  */
 export async function checkEmailAvailability(email: string): Promise<boolean> {
   // Validate email format
-  const emailSchema = z.string().email()
-  const validationResult = emailSchema.safeParse(email)
+  const validationResult = EmailSchema.safeParse(email)
 
   if (!validationResult.success) {
     return false // Invalid email format
@@ -141,8 +139,7 @@ export async function checkEmailAvailability(email: string): Promise<boolean> {
  * @returns FormState indicating success/failure
  */
 export async function requestPasswordReset(email: string): Promise<FormState> {
-  const emailSchema = z.string().email()
-  const validationResult = emailSchema.safeParse(email)
+  const validationResult = EmailSchema.safeParse(email)
 
   if (!validationResult.success) {
     return {
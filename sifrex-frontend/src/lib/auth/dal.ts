@@ -10,6 +10,8 @@ import { cache } from 'react'
 import { redirect } from 'next/navigation'
 import type { User } from '@/lib/auth/definitions' // Asegúrate de que esta ruta sea correcta y el tipo User esté bien definido
 import { Role } from '@prisma/client'
+import { isDevelopmentBypass, devUser } from '@/lib/auth/dev-bypass'
+import { defaultLocale } from '@/lib/i18n'
 
 /**
  * CRITICAL: This is your PRIMARY security boundary
@@ -17,33 +19,22 @@ import { Role } from '@prisma/client'
  * All sensitive data access MUST verify auth here
  */
 
+// Trazas de depuración solo en desarrollo: en producción no se escribe a la consola en cada solicitud
+const isDev = process.env.NODE_ENV === 'development'
+
 // Cache the session verification for performance
 export const verifySession = cache(async () => {
-  console.log('DAL: verifySession called');
+  if (isDev) console.log('DAL: verifySession called');
 
   // --- LÓGICA DE BYPASS PARA DESARROLLO (NUNCA EN PRODUCCIÓN) ---
-  // STRICT security conditions to prevent accidental production bypass
-  const isDevelopmentBypass = (
-    process.env.NODE_ENV === 'development' && 
-    process.env.DEV_DAL_BYPASS === 'true' &&
-    process.env.DATABASE_URL?.includes('localhost') && // Must be local DB
-    !process.env.VERCEL_ENV && // Not on Vercel
-    !process.env.RAILWAY_ENVIRONMENT && // Not on Railway
-    !process.env.HEROKU_APP_NAME // Not on Heroku
-  );
-  
+  // STRICT security conditions to prevent accidental production bypass (see dev-bypass.ts)
   if (isDevelopmentBypass) {
-    // En este escenario, como no hay DB conectada, estos son IDs/emails simulados en memoria.
-    const devUserId = process.env.DEV_USER_ID || 'dev-dal-user-id-default';
-    const devUserEmail = process.env.DEV_USER_EMAIL || 'dev-dal-default@example.com';
-    const devUserRole = (process.env.DEV_USER_ROLE as 'BASIC' | 'PLUS' | 'PREMIUM' | 'PREMIUM_PLUS' | 'ADMIN' | 'SUPER_ADMIN') || 'ADMIN';
-
-    console.log(`DAL: Bypass activo. Sesión inyectada para User ID: ${devUserId}, Email: ${devUserEmail}`);
+    console.log(`DAL: Bypass activo. Sesión inyectada para User ID: ${devUser.id}, Email: ${devUser.email}`);
     return {
       isAuth: true,
-      userId: devUserId,
-      userEmail: devUserEmail,
-      userRole: devUserRole,
+      userId: devUser.id,
+      userEmail: devUser.email,
+      userRole: devUser.role,
     };
   }
   // --- FIN LÓGICA DE BYPASS PARA DESARROLLO ---
@@ -52,11 +43,11 @@ export const verifySession = cache(async () => {
   const session = await auth(); // NextAuth.js session
 
   if (!session?.user?.id) {
-    console.log('DAL: verifySession - No session found. Redirecting to /es/auth/signin');
-    redirect('/es/signin'); // Redirige a la página de login con el locale correcto
+    if (isDev) console.log(`DAL: verifySession - No session found. Redirecting to /${defaultLocale}/signin`);
+    redirect(`/${defaultLocale}/signin`); // Redirige a la página de login con el locale correcto
   }
 
-  console.log('DAL: verifySession - Sesión válida para usuario:', session.user.id);
+  if (isDev) console.log('DAL: verifySession - Sesión válida para usuario:', session.user.id);
   return {
     isAuth: true,
     userId: session.user.id,
@@ -74,13 +65,13 @@ export async function getCurrentUser(): Promise<User | null> {
 
   // Cuando no hay DB conectada, la consulta a Prisma fallará.
   // Para desarrollo, podemos devolver un objeto User simulado directamente aquí.
-  if (process.env.NODE_ENV === 'development' && process.env.DEV_DAL_BYPASS === 'true' && !prisma) {
+  if (isDevelopmentBypass && !prisma) {
       console.warn(`DAL: getCurrentUser - No DB connected or bypass active. Returning simulated user.`);
       return {
           id: userId,
           name: 'Dev Bypass User',
-          email: (process.env.DEV_USER_EMAIL as string) || 'dev-dal-default@example.com',
-          role: (process.env.DEV_USER_ROLE as 'BASIC' | 'PLUS' | 'PREMIUM' | 'PREMIUM_PLUS' | 'ADMIN' | 'SUPER_ADMIN') || 'ADMIN',
+          email: devUser.email,
+          role: devUser.role,
       } as User;
   }
 
@@ -97,15 +88,15 @@ export async function getCurrentUser(): Promise<User | null> {
     });
 
     // Este if se activa si el usuario no existe en la DB real (cuando ya esté conectada)
-    if (!user && process.env.NODE_ENV === 'development' && process.env.DEV_DAL_BYPASS === 'true') {
+    if (!user && isDevelopmentBypass) {
         console.warn(`DAL: getCurrentUser - Usuario con ID inyectado '${userId}' no encontrado en DB real.`);
         // Para desarrollo, podrías devolver un objeto User simulado si el usuario no existe en DB,
         // O simplemente devolver null, lo que podría afectar los componentes que esperan un usuario real.
         return {
             id: userId,
             name: 'Dev Bypass User (from DB check)',
-            email: (process.env.DEV_USER_EMAIL as string) || 'dev-dal-default@example.com',
-            role: (process.env.DEV_USER_ROLE as 'BASIC' | 'PLUS' | 'PREMIUM' | 'PREMIUM_PLUS' | 'ADMIN' | 'SUPER_ADMIN') || 'ADMIN',
+            email: devUser.email,
+            role: devUser.role,
         } as User;
     }
 
@@ -158,7 +149,7 @@ export async function getUserTenantData(tenantId: string) {
 
   // Cuando no hay DB conectada, la consulta a Prisma fallará.
   // Para desarrollo con bypass, podemos simular que el usuario tiene acceso al tenant.
-  if (process.env.NODE_ENV === 'development' && process.env.DEV_DAL_BYPASS === 'true' && !prisma) {
+  if (isDevelopmentBypass && !prisma) {
       console.warn(`DAL: getUserTenantData - No DB connected or bypass active. Simulating tenant access.`);
       return { userId, tenantId };
   }
@@ -239,7 +230,7 @@ export async function getAdminData() {
   return getSecureData(async (userId) => {
     // Admin-specific data access
     // Si no hay DB, las consultas a Prisma fallarán. Podrías simular datos aquí.
-    if (process.env.NODE_ENV === 'development' && process.env.DEV_DAL_BYPASS === 'true' && !prisma) {
+    if (isDevelopmentBypass && !prisma) {
         console.warn(`DAL: getAdminData - No DB connected or bypass active. Returning simulated admin data.`);
         return {
             totalUsers: 999, // Datos simulados
@@ -265,7 +256,7 @@ export async function getBusinessData(resourceId: string) {
 
   return getSecureData(async () => {
     // Example: Get business-specific data
-    if (process.env.NODE_ENV === 'development' && process.env.DEV_DAL_BYPASS === 'true' && !prisma) {
+    if (isDevelopmentBypass && !prisma) {
         console.warn(`DAL: getBusinessData - No DB connected or bypass active. Returning simulated data.`);
         return {
             id: resourceId,
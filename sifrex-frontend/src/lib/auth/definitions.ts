@@ -23,6 +23,9 @@ export const SigninFormSchema = z.object({
   password: z.string().min(1, { message: 'Password is required.' }).trim(),
 })
 
+// Standalone email check (availability, password reset)
+export const EmailSchema = z.string().email()
+
 // Form state types
 export type FormState =
   | {
@@ -0,0 +1,33 @@
+// File: /src/lib/auth/dev-bypass.ts
+// Development bypass configuration - REMOVE FOR PRODUCTION
+
+/**
+ * Development bypass flag and simulated user
+ *
+ * Environment variables are read once when the module loads, so the
+ * middleware and the DAL share a single evaluation instead of repeating
+ * the same `process.env` checks on every request.
+ *
+ * SECURITY NOTES:
+ * - STRICT conditions: development mode, explicit opt-in and a local DB
+ * - Never active on hosted platforms (Vercel, Railway, Heroku)
+ * - Kept free of Node-only imports so the middleware can use it
+ */
+
+type DevUserRole = 'BASIC' | 'PLUS' | 'PREMIUM' | 'PREMIUM_PLUS' | 'ADMIN' | 'SUPER_ADMIN'
+
+export const isDevelopmentBypass = (
+  process.env.NODE_ENV === 'development' &&
+  process.env.DEV_DAL_BYPASS === 'true' &&
+  !!process.env.DATABASE_URL?.includes('localhost') && // Must be local DB
+  !process.env.VERCEL_ENV && // Not on Vercel
+  !process.env.RAILWAY_ENVIRONMENT && // Not on Railway
+  !process.env.HEROKU_APP_NAME // Not on Heroku
+)
+
+// En este escenario, como no hay DB conectada, estos son IDs/emails simulados en memoria.
+export const devUser = {
+  id: process.env.DEV_USER_ID || 'dev-dal-user-id-default',
+  email: process.env.DEV_USER_EMAIL || 'dev-dal-default@example.com',
+  role: (process.env.DEV_USER_ROLE as DevUserRole) || 'ADMIN',
+} as const
@@ -19,6 +19,7 @@ import { PrismaClient } from '@prisma/client'
 
 const globalForPrisma = globalThis as unknown as {
   prisma: PrismaClient | undefined
+  prismaShutdownHooks: boolean | undefined
 }
 
 export const prisma = globalForPrisma.prisma ?? new PrismaClient({
@@ -42,13 +43,20 @@ if (process.env.NODE_ENV !== 'production') {
 /**
  * Graceful shutdown handling
  * Ensures database connections are properly closed
+ *
+ * Registered once per process: hot reloads re-evaluate this module but
+ * reuse the same client, so they must not stack extra disconnect handlers.
  */
-process.on('SIGINT', async () => {
-  await prisma.$disconnect()
-  process.exit(0)
-})
-
-process.on('SIGTERM', async () => {
-  await prisma.$disconnect()
-  process.exit(0)
-})
\ No newline at end of file
+if (!globalForPrisma.prismaShutdownHooks) {
+  globalForPrisma.prismaShutdownHooks = true
+
+  process.on('SIGINT', async () => {
+    await prisma.$disconnect()
+    process.exit(0)
+  })
+
+  process.on('SIGTERM', async () => {
+    await prisma.$disconnect()
+    process.exit(0)
+  })
+}
\ No newline at end of file
@@ -1,54 +1,78 @@
 // Rate limiting for authentication endpoints
 // Prevents brute force attacks
+//
+// Token bucket: each identifier starts with MAX_ATTEMPTS tokens and every
+// attempt spends one. Tokens refill continuously at MAX_ATTEMPTS per
+// RATE_LIMIT_WINDOW, so a key only needs two numbers of state and there is
+// no window boundary where a burst of 2x MAX_ATTEMPTS gets through.
 
-interface RateLimitStore {
-  [key: string]: {
-    count: number;
-    resetTime: number;
-  };
+interface TokenBucket {
+  tokens: number;     // Tokens left after the last attempt
+  lastRefill: number; // Monotonic time (performance.now(), ms) of the last attempt
 }
 
 // In-memory store (use Redis for production)
-const store: RateLimitStore = {};
+// Each server process keeps its own buckets, so with several instances the
+// effective limit is multiplied by the instance count. A shared store must run
+// the refill + spend step below atomically (e.g. a single Redis Lua script)
+// to keep one round trip per check.
+//
+// Buckets are re-inserted on every attempt, so the Map iterates in
+// lastRefill order and idle keys can be expired from the front.
+const store = new Map<string, TokenBucket>();
 
 const RATE_LIMIT_WINDOW = 15 * 60 * 1000; // 15 minutes
-const MAX_ATTEMPTS = 5; // Max attempts per window
+const MAX_ATTEMPTS = 5; // Max attempts per window (bucket capacity)
+const REFILL_PER_MS = MAX_ATTEMPTS / RATE_LIMIT_WINDOW;
 
 export function checkRateLimit(identifier: string): {
   allowed: boolean;
   remaining: number;
   resetTime: number;
 } {
-  const now = Date.now();
+  // Refill is measured on the monotonic clock so wall-clock adjustments
+  // (NTP, manual changes) cannot grant or withhold tokens.
+  const now = performance.now();
   const key = `auth:${identifier}`;
-  
-  // Clean expired entries
-  if (store[key] && store[key].resetTime < now) {
-    delete store[key];
-  }
-  
-  // Initialize if not exists
-  if (!store[key]) {
-    store[key] = {
-      count: 0,
-      resetTime: now + RATE_LIMIT_WINDOW,
-    };
-  }
-  
-  // Increment counter
-  store[key].count++;
-  
-  const allowed = store[key].count <= MAX_ATTEMPTS;
-  const remaining = Math.max(0, MAX_ATTEMPTS - store[key].count);
-  
+
+  pruneExpired(now);
+
+  const bucket = store.get(key);
+
+  // Refill the tokens earned since the last attempt, capped at capacity
+  const tokens = bucket
+    ? Math.min(MAX_ATTEMPTS, bucket.tokens + (now - bucket.lastRefill) * REFILL_PER_MS)
+    : MAX_ATTEMPTS;
+
+  // Spend one token if available
+  const allowed = tokens >= 1;
+  const remainingTokens = allowed ? tokens - 1 : tokens;
+
+  // Re-insert so this key moves to the end of the iteration order
+  store.delete(key);
+  store.set(key, { tokens: remainingTokens, lastRefill: now });
+
   return {
     allowed,
-    remaining,
-    resetTime: store[key].resetTime,
+    remaining: Math.floor(remainingTokens),
+    // Wall-clock timestamp at which the bucket is full again
+    resetTime: Date.now() + Math.ceil((MAX_ATTEMPTS - remainingTokens) / REFILL_PER_MS),
   };
 }
 
+// Drop buckets idle for a full window: they have refilled to capacity and
+// are equivalent to a missing key. Stops at the first recent entry, so the
+// cost is proportional to the number of keys removed and memory stays
+// bounded by the keys seen in the last window, even under a flood of
+// distinct identifiers.
+function pruneExpired(now: number): void {
+  for (const [key, bucket] of store) {
+    if (now - bucket.lastRefill < RATE_LIMIT_WINDOW) break;
+    store.delete(key);
+  }
+}
+
 export function resetRateLimit(identifier: string): void {
   const key = `auth:${identifier}`;
-  delete store[key];
-}
\ No newline at end of file
+  store.delete(key);
+}
@@ -0,0 +1,15 @@
+// File: /src/lib/i18n.ts
+// Configuración de Internacionalización (i18n) compartida por el middleware,
+// los layouts y generateStaticParams. Sin dependencias de Node: la usa el middleware.
+
+export const locales = ['es', 'en'] as const; // Idiomas soportados por tu aplicación
+export const defaultLocale = 'es';            // Idioma por defecto
+
+export type Locale = (typeof locales)[number];
+
+// Set construido una sola vez para comprobar locales con un lookup en cada solicitud.
+const localeSet: ReadonlySet<string> = new Set(locales);
+
+export function isLocale(value: string): value is Locale {
+  return localeSet.has(value);
+}
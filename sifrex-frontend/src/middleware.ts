@@ -17,21 +17,44 @@
 
 import { NextResponse } from 'next/server';
 import type { NextRequest } from 'next/server';
-import { auth } from '../auth'; // Asegúrate de que 'auth' esté configurado correctamente
+import NextAuth from 'next-auth';
+import authConfig from '../auth.config'; // Configuración edge-safe (sin Prisma ni bcrypt)
+import { isDevelopmentBypass } from '@/lib/auth/dev-bypass';
+import { defaultLocale, isLocale } from '@/lib/i18n';
+
+// Aviso una sola vez al cargar el módulo, no en cada solicitud.
+if (isDevelopmentBypass) {
+  console.log('🚨 DEV BYPASS ACTIVE - Remove DEV_DAL_BYPASS for production!');
+}
 
-// --- Configuración de Internacionalización (i18n) ---
-const locales = ['es', 'en']; // Idiomas soportados por tu aplicación
-const defaultLocale = 'es';   // Idioma por defecto
+// Instancia de NextAuth solo para leer la sesión (JWT) en el middleware.
+// No usa el adapter de Prisma: la base de datos nunca se carga en este bundle.
+const { auth } = NextAuth(authConfig);
 
 // --- Rutas Públicas (acceso sin autenticación) ---
 // IMPORTANT: Estas rutas son solo para redirecciones optimistas en el middleware.
 // Aun así, la lógica de autenticación real de estas páginas (ej. registro, login)
 // debe manejar la sesión de forma segura y validar las credenciales en el backend.
-const publicRoutes = [
-  '/signin',
-  '/signup',
-  '/forgot-password',
-  '/reset-password',
+// Se guardan como primer segmento de la ruta para comprobarlas con un lookup en un Set.
+const publicRoutes = new Set([
+  'signin',
+  'signup',
+  'forgot-password',
+  'reset-password',
+]);
+
+// --- Cabeceras internas que nunca deben aceptarse del cliente ---
+const internalHeaders = ['x-middleware-subrequest', 'x-forwarded-middleware'];
+
+// --- Cabeceras de Seguridad (Defensa en Profundidad) ---
+// Se construyen una sola vez al cargar el módulo; en cada solicitud solo se copian a la respuesta.
+// Los nombres van en minúsculas, que es como `Headers` los almacena internamente.
+const securityHeaders: ReadonlyArray<readonly [string, string]> = [
+  ['x-frame-options', 'DENY'],           // Previene Clickjacking
+  ['x-content-type-options', 'nosniff'], // Previene MIME-sniffing
+  ['referrer-policy', 'strict-origin-when-cross-origin'], // Controla el header Referer
+  ['x-xss-protection', '1; mode=block'], // Habilita la protección XSS en navegadores antiguos
+  ['strict-transport-security', 'max-age=31536000; includeSubDomains; preload'], // HSTS para HTTPS
 ];
 
 // --- Funciones Auxiliares ---
@@ -43,50 +66,65 @@ function getLocale(): string {
   return defaultLocale;
 }
 
-// Extrae el pathname sin el prefijo del locale
-function getPathnameWithoutLocale(pathname: string): string {
-  const segments = pathname.split('/');
-  if (locales.includes(segments[1])) {
-    return '/' + segments.slice(2).join('/'); // /es/dashboard -> /dashboard
+// Extrae el primer segmento del pathname (/es/dashboard -> 'es').
+// Se detiene en la primera '/' en lugar de dividir toda la ruta con split().
+function getFirstSegment(pathname: string): string {
+  const end = pathname.indexOf('/', 1);
+  return end === -1 ? pathname.slice(1) : pathname.slice(1, end);
+}
+
+// Extrae el pathname sin el prefijo del locale (/es/dashboard -> /dashboard)
+function getPathnameWithoutLocale(pathname: string, locale: string): string {
+  return pathname.slice(locale.length + 1) || '/';
+}
+
+// Continúa la solicitud aplicando la mitigación de cabeceras internas y las cabeceras de seguridad.
+function nextWithSecurityHeaders(request: NextRequest): NextResponse {
+  // Mitigación de Cabeceras Maliciosas (CVE-2025-29927 y defensa en profundidad)
+  // Solo se clonan los headers cuando realmente llega alguna cabecera interna:
+  // en el caso normal no hay nada que limpiar y evitamos copiar todos los headers en cada solicitud.
+  // Considera añadir a `internalHeaders` cualquier otro header interno que no deba exponerse o manipularse.
+  const cleanHeaders = internalHeaders.some((header) => request.headers.has(header))
+    ? new Headers(request.headers)
+    : null;
+  if (cleanHeaders) {
+    for (const header of internalHeaders) {
+      cleanHeaders.delete(header);
+    }
   }
-  return pathname; // Si no tiene locale, lo devuelve tal cual
+
+  // Cabeceras de Seguridad en la Respuesta (Defensa en Profundidad)
+  // Continúa con la solicitud original, o con los headers limpios si hubo que eliminar alguno.
+  const response = cleanHeaders
+    ? NextResponse.next({ request: { headers: cleanHeaders } })
+    : NextResponse.next();
+
+  // Añade headers HTTP para endurecer la seguridad del navegador.
+  for (const [name, value] of securityHeaders) {
+    response.headers.set(name, value);
+  }
+
+  // Asegúrate de que ninguna cabecera interna potencialmente peligrosa sea pasada a la respuesta del cliente.
+  for (const header of internalHeaders) {
+    response.headers.delete(header); // Por si acaso también en la respuesta
+  }
+
+  return response;
 }
 
 // --- Lógica Principal del Middleware ---
 export default auth((request: NextRequest & { auth: unknown }) => {
   const { pathname } = request.nextUrl;
   
-  // Development bypass - STRICT conditions for security
-  const isDevelopmentBypass = (
-    process.env.NODE_ENV === 'development' && 
-    process.env.DEV_DAL_BYPASS === 'true' &&
-    process.env.DATABASE_URL?.includes('localhost') // Extra safety check
-  );
-  
-  if (isDevelopmentBypass) {
-    console.log('🚨 DEV BYPASS ACTIVE - Remove DEV_DAL_BYPASS for production!');
-  }
-  
+  // Development bypass - STRICT conditions for security (evaluated once in dev-bypass.ts)
   const isAuthenticated = !!request.auth || isDevelopmentBypass;
 
-  // --- 1. Mitigación de Cabeceras Maliciosas (CVE-2025-29927 y defensa en profundidad) ---
-  // Clonar los headers para modificarlos de forma segura.
-  const modifiedHeaders = new Headers(request.headers);
-  modifiedHeaders.delete('x-middleware-subrequest');
-  modifiedHeaders.delete('x-forwarded-middleware');
-  // Considera eliminar cualquier otro header interno que no deba exponerse o manipularse.
-
-  // Headers are cleaned for security
-  // Note: If you need to use cleaned headers later, you can recreate the request
-  // const cleanRequest = new Request(request.url, { method: request.method, headers: modifiedHeaders, body: request.body, duplex: 'half' });
-
-  // --- 2. Manejo de Internacionalización (i18n) ---
-  const pathnameHasLocale = locales.some(
-    (locale) => pathname.startsWith(`/${locale}/`) || pathname === `/${locale}`
-  );
+  // --- 1. Manejo de Internacionalización (i18n) ---
+  const firstSegment = getFirstSegment(pathname);
+  const pathnameHasLocale = isLocale(firstSegment);
 
   const currentLocale = pathnameHasLocale
-    ? pathname.split('/')[1]
+    ? firstSegment
     : getLocale(); // Si la URL no tiene locale, detecta uno
 
   // Redirige si la URL no tiene un locale (ej. /dashboard -> /es/dashboard)
@@ -96,12 +134,11 @@ export default auth((request: NextRequest & { auth: unknown }) => {
   }
 
   // Obtiene el pathname sin el locale para las comprobaciones de ruta
-  const pathnameWithoutLocale = getPathnameWithoutLocale(pathname);
+  const pathnameWithoutLocale = getPathnameWithoutLocale(pathname, currentLocale);
 
-  // --- 3. Lógica de Redirección Optimista (UX) ---
-  const isPublicRoute = publicRoutes.some(route =>
-    pathnameWithoutLocale.startsWith(route)
-  );
+  // --- 2. Lógica de Redirección Optimista (UX) ---
+  // /signin y /signin/... son públicas; /signin-admin ya no coincide por prefijo.
+  const isPublicRoute = publicRoutes.has(getFirstSegment(pathnameWithoutLocale));
 
   if (!isPublicRoute && !isAuthenticated) {
     // Si no es una ruta pública Y el usuario NO está autenticado,
@@ -119,23 +156,14 @@ export default auth((request: NextRequest & { auth: unknown }) => {
     return NextResponse.redirect(new URL(`/${currentLocale}/dashboard`, request.url));
   }
 
-  // --- 4. Añadir Cabeceras de Seguridad a la Respuesta (Defensa en Profundidad) ---
-  const response = NextResponse.next(); // Continúa con la solicitud original o la solicitud limpia si se modificó.
-
-  // Añade headers HTTP para endurecer la seguridad del navegador.
-  response.headers.set('X-Frame-Options', 'DENY');           // Previene Clickjacking
-  response.headers.set('X-Content-Type-Options', 'nosniff'); // Previene MIME-sniffing
-  response.headers.set('Referrer-Policy', 'strict-origin-when-cross-origin'); // Controla el header Referer
-  response.headers.set('X-XSS-Protection', '1; mode=block'); // Habilita la protección XSS en navegadores antiguos
-  response.headers.set('Strict-Transport-Security', 'max-age=31536000; includeSubDomains; preload'); // HSTS para HTTPS
-
-  // Asegúrate de que ninguna cabecera interna potencialmente peligrosa sea pasada a la respuesta del cliente.
-  response.headers.delete('x-middleware-subrequest');
-  response.headers.delete('x-forwarded-middleware'); // Por si acaso también en la respuesta
+  if (request.auth && getFirstSegment(pathnameWithoutLocale) !== 'dashboard') {
+    // Con sesión iniciada, cualquier ruta fuera del dashboard (incluida la raíz del locale, /es)
+    // redirige al dashboard. Antes lo hacía el callback `authorized` de NextAuth.
+    return NextResponse.redirect(new URL(`/${currentLocale}/dashboard`, request.url));
+  }
 
-  // Si usaste 'cleanRequest' para procesar, asegúrate de devolver su respuesta.
-  // En este caso, como solo modificamos headers, 'NextResponse.next()' está bien.
-  return response;
+  // --- 3. Continuar con cabeceras limpias y de seguridad ---
+  return nextWithSecurityHeaders(request);
 });
 
 // --- Configuración del Matcher ---